@@ -1,9 +1,19 @@
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from prompt_toolkit.application import Application
 from prompt_toolkit.key_binding import KeyBindings
 from prompt_toolkit.keys import Keys
-from prompt_toolkit.styles import Style, merge_styles
+from prompt_toolkit.styles import BaseStyle, Style, merge_styles
 from prompt_toolkit.formatted_text import FormattedText
 
 from questionary import utils
@@ -14,9 +24,36 @@ from questionary.constants import (
     INVALID_INPUT,
 )
 from questionary.prompts import common
-from questionary.prompts.common import Choice, InquirerControl, Separator
+from questionary.prompts.common import Choice, InquirerControl
 from questionary.question import Question
 
+# Disable the default inverted colours bottom-toolbar behaviour (for
+# the error message). However it can be re-enabled with a custom style.
+_NOREVERSE_BOTTOM_TOOLBAR_STYLE = Style([("bottom-toolbar", "noreverse")])
+
+
+@lru_cache(maxsize=32)
+def _validation_error_message(error_text: str) -> FormattedText:
+    """Error toolbar text, reused while the validator keeps failing."""
+    return FormattedText([("class:validation-toolbar", error_text)])
+
+
+@lru_cache(maxsize=8)
+def _merged_style(style: Optional[Style]) -> BaseStyle:
+    """Checkbox style, shared by all prompts using the same custom ``style``."""
+    return merge_styles(
+        [
+            DEFAULT_STYLE,
+            _NOREVERSE_BOTTOM_TOOLBAR_STYLE,
+            style,
+        ]
+    )
+
+
+def _noop(_event: Any) -> None:
+    """Disallow inserting other text."""
+    pass
+
 
 def checkbox(
     message: str,
@@ -102,16 +139,7 @@ def checkbox(
             "Some option to move the selection is required. Arrow keys or j/k keys."
         )
 
-    merged_style = merge_styles(
-        [
-            DEFAULT_STYLE,
-            # Disable the default inverted colours bottom-toolbar behaviour (for
-            # the error message). However it can be re-enabled with a custom
-            # style.
-            Style([("bottom-toolbar", "noreverse")]),
-            style,
-        ]
-    )
+    merged_style = _merged_style(style)
 
     if not callable(validate):
         raise ValueError("validate must be callable")
@@ -120,47 +148,57 @@ def checkbox(
         choices, default, pointer=pointer, initial_choice=initial_choice
     )
 
-    def get_prompt_tokens() -> List[Tuple[str, str]]:
-        tokens = []
-
-        tokens.append(("class:qmark", qmark))
-        tokens.append(("class:question", " {} ".format(message)))
+    # the choices never change while the prompt is shown, so the values
+    # that can be (de)selected with <a> and <i> only need to be found once
+    selectable_values = ic.get_selectable_values()
+
+    qmark_token = ("class:qmark", qmark)
+    question_token = ("class:question", f" {message} ")
+    instruction_token = (
+        "class:instruction",
+        "(Use arrow keys to move, "
+        "<space> to select, "
+        "<a> to toggle, "
+        "<i> to invert)",
+    )
 
-        if ic.is_answered:
-            nbr_selected = len(ic.selected_options)
-            if nbr_selected == 0:
-                tokens.append(("class:answer", "done"))
-            elif nbr_selected == 1:
-                if isinstance(ic.get_selected_values()[0].title, list):
-                    ts = ic.get_selected_values()[0].title
-                    tokens.append(
-                        (
-                            "class:answer",
-                            "".join([token[1] for token in ts]),  # type:ignore
-                        )
-                    )
-                else:
-                    tokens.append(
-                        (
-                            "class:answer",
-                            "[{}]".format(ic.get_selected_values()[0].title),
-                        )
-                    )
+    def build_prompt_tokens() -> List[Tuple[str, str]]:
+        if not ic.is_answered:
+            return [qmark_token, question_token, instruction_token]
+
+        nbr_selected = len(ic.selected_options)
+        if nbr_selected == 0:
+            answer = "done"
+        elif nbr_selected == 1:
+            selected = ic.get_selected_values()[0]
+            if isinstance(selected.title, list):
+                answer = "".join(token[1] for token in selected.title)
             else:
-                tokens.append(
-                    ("class:answer", "done ({} selections)".format(nbr_selected))
-                )
+                answer = f"[{selected.title}]"
+        else:
+            answer = f"done ({nbr_selected} selections)"
+        return [qmark_token, question_token, ("class:answer", answer)]
+
+    # the prompt is re-rendered far more often than its tokens change, so
+    # they are only rebuilt if one of their inputs differs from last time.
+    # before the question is answered the tokens are constant
+    tokens_cache_key: Optional[Tuple[bool, int, int]] = None
+    tokens_cache: List[Tuple[str, str]] = []
+
+    def get_prompt_tokens() -> List[Tuple[str, str]]:
+        nonlocal tokens_cache_key, tokens_cache
+
+        if not ic.is_answered:
+            key = (False, 0, 0)
         else:
-            tokens.append(
-                (
-                    "class:instruction",
-                    "(Use arrow keys to move, "
-                    "<space> to select, "
-                    "<a> to toggle, "
-                    "<i> to invert)",
-                )
-            )
-        return tokens
+            nbr_selected = len(ic.selected_options)
+            title = ic.get_selected_values()[0].title if nbr_selected == 1 else None
+            key = (True, nbr_selected, id(title))
+
+        if key != tokens_cache_key:
+            tokens_cache = build_prompt_tokens()
+            tokens_cache_key = key
+        return tokens_cache
 
     def get_selected_values() -> List[Any]:
         return [c.value for c in ic.get_selected_values()]
@@ -170,17 +208,16 @@ def checkbox(
         verdict = validate(selected_values)
         valid = verdict is True
 
-        if not valid:
+        # the error message is only shown once the user tried to submit
+        if valid or not ic.submission_attempted:
+            ic.error_message = None
+        else:
             if verdict is False:
                 error_text = INVALID_INPUT
             else:
                 error_text = str(verdict)
 
-            error_message = FormattedText([("class:validation-toolbar", error_text)])
-
-        ic.error_message = (
-            error_message if not valid and ic.submission_attempted else None
-        )
+            ic.error_message = _validation_error_message(error_text)
 
         return valid
 
@@ -188,6 +225,15 @@ def checkbox(
 
     bindings = KeyBindings()
 
+    # bound methods used by the key handlers, looked up once instead of on
+    # every keypress. they stay valid as they read ``ic``'s state when called
+    get_pointed_at = ic.get_pointed_at
+    is_value_selected = ic.is_value_selected
+    select_value = ic.select_value
+    deselect_value = ic.deselect_value
+    select_next = ic.select_next
+    select_previous = ic.select_previous
+
     @bindings.add(Keys.ControlQ, eager=True)
     @bindings.add(Keys.ControlC, eager=True)
     def _(event):
@@ -195,53 +241,39 @@ def checkbox(
 
     @bindings.add(" ", eager=True)
     def toggle(_event):
-        pointed_choice = ic.get_pointed_at().value
-        if pointed_choice in ic.selected_options:
-            ic.selected_options.remove(pointed_choice)
+        pointed_choice = get_pointed_at().value
+        if is_value_selected(pointed_choice):
+            deselect_value(pointed_choice)
         else:
-            ic.selected_options.append(pointed_choice)
+            select_value(pointed_choice)
 
-        perform_validation(get_selected_values())
+        if ic.submission_attempted:
+            perform_validation(get_selected_values())
 
     @bindings.add("i", eager=True)
     def invert(_event):
-        inverted_selection = [
-            c.value
-            for c in ic.choices
-            if not isinstance(c, Separator)
-            and c.value not in ic.selected_options
-            and not c.disabled
-        ]
-        ic.selected_options = inverted_selection
+        ic.set_selected_options(ic.get_unselected_values(selectable_values))
 
-        perform_validation(get_selected_values())
+        if ic.submission_attempted:
+            perform_validation(get_selected_values())
 
     @bindings.add("a", eager=True)
     def all(_event):
-        all_selected = True  # all choices have been selected
-        for c in ic.choices:
-            if (
-                not isinstance(c, Separator)
-                and c.value not in ic.selected_options
-                and not c.disabled
-            ):
-                # add missing ones
-                ic.selected_options.append(c.value)
-                all_selected = False
-        if all_selected:
-            ic.selected_options = []
-
-        perform_validation(get_selected_values())
+        missing = [v for v in selectable_values if not is_value_selected(v)]
+        if missing:
+            ic.select_values(missing)
+        else:
+            # all choices have been selected
+            ic.set_selected_options([])
+
+        if ic.submission_attempted:
+            perform_validation(get_selected_values())
 
     def move_cursor_down(event):
-        ic.select_next()
-        while not ic.is_selection_valid():
-            ic.select_next()
+        select_next()
 
     def move_cursor_up(event):
-        ic.select_previous()
-        while not ic.is_selection_valid():
-            ic.select_previous()
+        select_previous()
 
     if use_arrow_keys:
         bindings.add(Keys.Down, eager=True)(move_cursor_down)
@@ -261,10 +293,9 @@ def checkbox(
             ic.is_answered = True
             event.app.exit(result=selected_values)
 
-    @bindings.add(Keys.Any)
-    def other(_event):
-        """Disallow inserting other text. """
-        pass
+    # the prompt's buffer has focus, so without this binding any other key
+    # would be inserted as text next to the question
+    bindings.add(Keys.Any)(_noop)
 
     return Question(
         Application(
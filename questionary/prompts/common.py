@@ -1,3 +1,4 @@
+import bisect
 import inspect
 from prompt_toolkit import PromptSession
 from prompt_toolkit.filters import IsDone, Always, Condition
@@ -10,7 +11,18 @@ from prompt_toolkit.layout import (
 )
 from prompt_toolkit.styles import Style, merge_styles
 from prompt_toolkit.validation import Validator, ValidationError
-from typing import Optional, Any, List, Dict, Union, Callable, Sequence, Tuple
+from typing import (
+    Optional,
+    Any,
+    List,
+    Dict,
+    FrozenSet,
+    Set,
+    Union,
+    Callable,
+    Sequence,
+    Tuple,
+)
 
 from questionary.constants import (
     DEFAULT_STYLE,
@@ -189,7 +201,12 @@ class InquirerControl(FormattedTextControl):
 
     choices: List[Choice]
     default: Optional[Union[str, Choice, Dict[str, Any]]]
-    selected_options: List[Any]
+    _selected_options: List[Any]
+    _selected_set: Set[Any]
+    _selected_values_cache: Optional[List[Choice]]
+    _valid_indices: List[int]
+    _valid_index_set: FrozenSet[int]
+    _selectable_values: List[Any]
     use_indicator: bool
     use_shortcuts: bool
     use_arrow_keys: bool
@@ -240,7 +257,9 @@ class InquirerControl(FormattedTextControl):
         self.choices = []
         self.submission_attempted = False
         self.error_message = None
-        self.selected_options = []
+        self._selected_options = []
+        self._selected_set = set()
+        self._selected_values_cache = None
 
         self._init_choices(choices, pointed_at)
         self._assign_shortcut_keys()
@@ -298,8 +317,10 @@ class InquirerControl(FormattedTextControl):
         for i, c in enumerate(choices):
             choice = Choice.build(c)
 
-            if self._is_selected(choice):
-                self.selected_options.append(choice.value)
+            # choices sharing a value share one selection: checking several
+            # of them selects the value once, and deselecting it unchecks all
+            if self._is_selected(choice) and not self.is_value_selected(choice.value):
+                self.select_value(choice.value)
 
             if pointed_at is None and not choice.disabled:
                 # find the first (available) choice
@@ -307,6 +328,42 @@ class InquirerControl(FormattedTextControl):
 
             self.choices.append(choice)
 
+        # whether a choice can be selected is decided once per control, so
+        # the pointer movement and the validity checks always agree
+        self._valid_indices = [
+            i
+            for i, c in enumerate(self.choices)
+            if not isinstance(c, Separator) and not c.disabled
+        ]
+        self._valid_index_set = frozenset(self._valid_indices)
+
+        # choices sharing a value must not get that value selected twice
+        self._selectable_values = []
+        seen: Set[Any] = set()
+        seen_unhashable: List[Any] = []
+        for i in self._valid_indices:
+            value = self.choices[i].value
+            try:
+                if value in seen:
+                    continue
+                seen.add(value)
+            except TypeError:
+                # unhashable values (e.g. lists) need a linear scan
+                if value in seen_unhashable:
+                    continue
+                seen_unhashable.append(value)
+            self._selectable_values.append(value)
+
+    @property
+    def selected_options(self) -> List[Any]:
+        """Values of the selected choices.
+
+        This is a copy, change the selection using :meth:`select_value`,
+        :meth:`select_values`, :meth:`deselect_value` or
+        :meth:`set_selected_options`, which keep the selection lookups in sync.
+        """
+        return list(self._selected_options)
+
     @property
     def choice_count(self) -> int:
         return len(self.choices)
@@ -316,7 +373,7 @@ class InquirerControl(FormattedTextControl):
 
         def append(index: int, choice: Choice):
             # use value to check if option has been selected
-            selected = choice.value in self.selected_options
+            selected = self.is_value_selected(choice.value)
 
             if index == self.pointed_at:
                 if self.pointer is not None:
@@ -414,24 +471,87 @@ class InquirerControl(FormattedTextControl):
         return self.choices[self.pointed_at].disabled
 
     def is_selection_valid(self) -> bool:
-        return not self.is_selection_disabled() and not self.is_selection_a_separator()
+        return self.pointed_at in self._valid_index_set
 
     def select_previous(self) -> None:
-        self.pointed_at = (self.pointed_at - 1) % self.choice_count
+        # jump directly to the previous valid choice, skipping separators
+        # and disabled choices (index -1 wraps around to the last one)
+        position = bisect.bisect_left(self._valid_indices, self.pointed_at)
+        self.pointed_at = self._valid_indices[position - 1]
 
     def select_next(self) -> None:
-        self.pointed_at = (self.pointed_at + 1) % self.choice_count
+        # jump directly to the next valid choice, wrapping around to the first
+        position = bisect.bisect_right(self._valid_indices, self.pointed_at)
+        self.pointed_at = self._valid_indices[position % len(self._valid_indices)]
 
     def get_pointed_at(self) -> Choice:
         return self.choices[self.pointed_at]
 
+    def get_selectable_values(self) -> List[Any]:
+        """Return the distinct values of all selectable choices, in order."""
+        return list(self._selectable_values)
+
+    def is_value_selected(self, value: Any) -> bool:
+        try:
+            return value in self._selected_set
+        except TypeError:
+            # unhashable values (e.g. lists) are only tracked in the list
+            return value in self._selected_options
+
+    def get_unselected_values(self, values: List[Any]) -> List[Any]:
+        """Return the items of ``values`` that are not selected, in order."""
+        try:
+            # every hashable selected value is in the set
+            return [v for v in values if v not in self._selected_set]
+        except TypeError:
+            return [v for v in values if not self.is_value_selected(v)]
+
+    def _add_to_selected_set(self, values: List[Any]) -> None:
+        try:
+            self._selected_set.update(values)
+        except TypeError:
+            # unhashable values (e.g. lists) are only tracked in the list
+            for v in values:
+                try:
+                    self._selected_set.add(v)
+                except TypeError:
+                    pass
+
+    def select_value(self, value: Any) -> None:
+        self._selected_values_cache = None
+        self._selected_options.append(value)
+        self._add_to_selected_set([value])
+
+    def select_values(self, values: List[Any]) -> None:
+        self._selected_values_cache = None
+        self._selected_options.extend(values)
+        self._add_to_selected_set(values)
+
+    def deselect_value(self, value: Any) -> None:
+        self._selected_values_cache = None
+        self._selected_options.remove(value)
+        try:
+            self._selected_set.discard(value)
+        except TypeError:
+            pass
+
+    def set_selected_options(self, values: List[Any]) -> None:
+        self._selected_values_cache = None
+        self._selected_options = list(values)
+        self._selected_set = set()
+        self._add_to_selected_set(values)
+
     def get_selected_values(self) -> List[Choice]:
-        # get values not labels
-        return [
-            c
-            for c in self.choices
-            if (not isinstance(c, Separator) and c.value in self.selected_options)
-        ]
+        # get values not labels. the selected choices are cached until the
+        # selection changes, as they are needed on every render of the prompt.
+        # a copy is returned so callers can not modify the cache
+        if self._selected_values_cache is None:
+            self._selected_values_cache = [
+                c
+                for c in self.choices
+                if (not isinstance(c, Separator) and self.is_value_selected(c.value))
+            ]
+        return list(self._selected_values_cache)
 
 
 def build_validator(validate: Any) -> Optional[Validator]:
@@ -1,5 +1,6 @@
 import inspect
-from typing import Any, Callable, Dict, List, Set
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Set
 
 ACTIVATED_ASYNC_MODE = False
 
@@ -28,6 +29,13 @@ def arguments_of(func: Callable[..., Any]) -> List[str]:
     return list(inspect.signature(func).parameters.keys())
 
 
+@lru_cache(maxsize=128)
+def _cached_argument_names(func: Callable[..., Any]) -> FrozenSet[str]:
+    """Return the parameter names of ``func``, inspecting it only once."""
+
+    return frozenset(arguments_of(func))
+
+
 def used_kwargs(kwargs: Dict[str, Any], func: Callable[..., Any]) -> Dict[str, Any]:
     """Returns only the kwargs which can be used by a function.
 
@@ -39,7 +47,11 @@ def used_kwargs(kwargs: Dict[str, Any], func: Callable[..., Any]) -> Dict[str, A
         Subset of kwargs which are accepted by ``func``.
     """
 
-    possible_arguments = arguments_of(func)
+    try:
+        possible_arguments = _cached_argument_names(func)
+    except TypeError:
+        # unhashable callables can not be cached
+        possible_arguments = frozenset(arguments_of(func))
 
     return {k: v for k, v in kwargs.items() if k in possible_arguments}
 
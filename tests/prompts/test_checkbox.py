@@ -2,6 +2,7 @@
 import pytest
 
 from questionary import Separator, Choice
+from questionary.prompts import common
 from tests.utils import feed_cli_with_input, KeyInputs
 
 
@@ -38,6 +39,31 @@ def test_select_first_choice_with_token_title():
     assert result == ["foo"]
 
 
+def test_answer_follows_changed_token_title(monkeypatch):
+    prompt_tokens = []
+    create_inquirer_layout = common.create_inquirer_layout
+
+    def capture_prompt_tokens(ic, get_prompt_tokens, **kwargs):
+        prompt_tokens.append(get_prompt_tokens)
+        return create_inquirer_layout(ic, get_prompt_tokens, **kwargs)
+
+    monkeypatch.setattr(common, "create_inquirer_layout", capture_prompt_tokens)
+
+    message = "Foo message"
+    choice = Choice(title=[("class:text", "Count: 1")], value="count")
+    text = KeyInputs.SPACE + KeyInputs.ENTER + "\r"
+
+    result, cli = feed_cli_with_input("checkbox", message, text, choices=[choice])
+    assert result == ["count"]
+    assert prompt_tokens[0]()[-1] == ("class:answer", "Count: 1")
+
+    choice.title = [("class:text", "Count: 2")]
+
+    result, cli = feed_cli_with_input("checkbox", message, text, choices=[choice])
+    assert result == ["count"]
+    assert prompt_tokens[1]()[-1] == ("class:answer", "Count: 2")
+
+
 def test_select_and_deselct():
     message = "Foo message"
     kwargs = {"choices": ["foo", "bar", "bazz"]}
@@ -149,6 +175,36 @@ def test_select_all_deselect():
     assert result == []
 
 
+def test_select_all_duplicate_values():
+    message = "Foo message"
+    kwargs = {
+        "choices": [
+            Choice("foo", value="foo"),
+            Choice("also foo", value="foo"),
+            "bazz",
+        ]
+    }
+    text = "a" + KeyInputs.SPACE + KeyInputs.ENTER + "\r"
+
+    result, cli = feed_cli_with_input("checkbox", message, text, **kwargs)
+    assert result == ["bazz"]
+
+
+def test_select_all_duplicate_unhashable_values():
+    message = "Foo message"
+    kwargs = {
+        "choices": [
+            Choice("one", value=[1]),
+            Choice("also one", value=[1]),
+            "two",
+        ]
+    }
+    text = "a" + KeyInputs.SPACE + KeyInputs.ENTER + "\r"
+
+    result, cli = feed_cli_with_input("checkbox", message, text, **kwargs)
+    assert result == ["two"]
+
+
 def test_select_invert():
     message = "Foo message"
     kwargs = {
@@ -166,6 +222,36 @@ def test_select_invert():
     assert result == ["bazz"]
 
 
+def test_select_all_and_invert_unhashable_values():
+    message = "Foo message"
+    kwargs = {
+        "choices": [
+            Choice("one", value=[1]),
+            Choice("two", value={"foo": "bar"}, checked=True),
+            Choice("three", value="three"),
+        ]
+    }
+    text = "i" + KeyInputs.SPACE + KeyInputs.ENTER + "\r"
+
+    result, cli = feed_cli_with_input("checkbox", message, text, **kwargs)
+    assert result == ["three"]
+
+
+def test_deselect_duplicate_checked_values():
+    message = "Foo message"
+    kwargs = {
+        "choices": [
+            Choice("foo", value="foo", checked=True),
+            Choice("also foo", value="foo", checked=True),
+            "bar",
+        ]
+    }
+    text = KeyInputs.SPACE + KeyInputs.ENTER + "\r"
+
+    result, cli = feed_cli_with_input("checkbox", message, text, **kwargs)
+    assert result == []
+
+
 def test_list_random_input():
     message = "Foo message"
     kwargs = {"choices": ["foo", "bazz"]}
@@ -175,6 +261,16 @@ def test_list_random_input():
     assert result == []
 
 
+def test_list_random_input_is_not_inserted():
+    message = "Foo message"
+    kwargs = {"choices": ["foo", "bazz"]}
+    text = "sdf" + KeyInputs.ENTER + "\r"
+
+    result, question = feed_cli_with_input("checkbox", message, text, **kwargs)
+    assert result == []
+    assert question.application.layout.current_buffer.text == ""
+
+
 def test_list_ctr_c():
     message = "Foo message"
     kwargs = {"choices": ["foo", "bazz"]}
@@ -253,6 +349,22 @@ def test_validate_with_message():
     assert result == ["foo", "bar", "bazz"]
 
 
+def test_validate_only_after_submission_attempt():
+    message = "Foo message"
+    validated = []
+
+    def validate(a):
+        validated.append(list(a))
+        return len(a) > 0
+
+    kwargs = {"choices": ["foo", "bar", "bazz"], "validate": validate}
+    text = "a" + "a" + KeyInputs.ENTER + KeyInputs.SPACE + KeyInputs.ENTER + "\r"
+
+    result, cli = feed_cli_with_input("checkbox", message, text, **kwargs)
+    assert result == ["foo"]
+    assert validated == [[], ["foo"], ["foo"]]
+
+
 def test_validate_not_callable():
     message = "Foo message"
     kwargs = {"choices": ["foo", "bar", "bazz"], "validate": "invalid"}
@@ -7,7 +7,7 @@ from prompt_toolkit.input.defaults import create_pipe_input
 from prompt_toolkit.output import ColorDepth, DummyOutput
 from prompt_toolkit.validation import ValidationError, Validator
 from questionary.prompts import common
-from questionary import Choice
+from questionary import Choice, Separator
 
 from questionary.prompts.common import (
     InquirerControl,
@@ -176,6 +176,105 @@ def test_prompt_show_answer_with_shortcuts():
     assert ic._get_choice_tokens() == expected_tokens
 
 
+def test_select_next_and_previous_skip_invalid_choices():
+    ic = InquirerControl(
+        [Separator(), "a", Choice("b", disabled="nope"), Separator(), "c", Separator()]
+    )
+
+    assert ic.pointed_at == 1
+    ic.select_next()
+    assert ic.pointed_at == 4
+    ic.select_next()
+    assert ic.pointed_at == 1
+    ic.select_previous()
+    assert ic.pointed_at == 4
+    ic.select_previous()
+    assert ic.pointed_at == 1
+
+
+def test_selectable_choices_are_fixed_per_control():
+    choice = Choice("b")
+    ic = InquirerControl(["a", choice])
+
+    choice.disabled = "later"
+    other = InquirerControl(["a", choice])
+    choice.disabled = None
+
+    assert ic.get_selectable_values() == ["a", "b"]
+    ic.select_next()
+    assert ic.pointed_at == 1
+    assert ic.is_selection_valid()
+
+    assert other.get_selectable_values() == ["a"]
+    other.select_next()
+    assert other.pointed_at == 0
+
+
+def test_selected_options_can_only_change_through_methods():
+    ic = InquirerControl(["a", Choice("b", checked=True), "c"])
+
+    with pytest.raises(AttributeError):
+        ic.selected_options = ["a"]
+
+    ic.selected_options.append("c")
+    assert ic.selected_options == ["b"]
+    assert not ic.is_value_selected("c")
+
+    ic.select_value("c")
+    assert ic.selected_options == ["b", "c"]
+    assert ic.is_value_selected("c")
+
+
+def test_get_unselected_values_keeps_order():
+    values = [str(i) for i in range(20)]
+    ic = InquirerControl(values)
+    ic.set_selected_options(["0", "5"])
+
+    unselected = ic.get_unselected_values(values)
+    assert unselected == [v for v in values if v not in ("0", "5")]
+
+    ic.set_selected_options(unselected)
+    assert ic.selected_options == unselected
+
+
+def test_get_unselected_values_unhashable():
+    ic = InquirerControl(
+        [Choice("a", value=[1]), Choice("b", value="b"), Choice("c", value=[3])]
+    )
+    ic.set_selected_options([[1]])
+
+    assert ic.get_unselected_values([[1], "b", [3]]) == ["b", [3]]
+
+
+def test_get_selectable_values_without_duplicates():
+    ic = InquirerControl(
+        [
+            Choice("a", value="a"),
+            Choice("also a", value="a"),
+            Separator(),
+            Choice("one", value=[1]),
+            Choice("disabled", value="d", disabled="nope"),
+            Choice("also one", value=[1]),
+            Choice("b", value="b"),
+        ]
+    )
+
+    assert ic.get_selectable_values() == ["a", [1], "b"]
+
+
+def test_get_selected_values_returns_copy():
+    ic = InquirerControl(["a", Choice("b", checked=True), "c"])
+
+    selected = ic.get_selected_values()
+    assert [c.value for c in selected] == ["b"]
+
+    selected.clear()
+    assert [c.value for c in ic.get_selected_values()] == ["b"]
+
+    ic.select_value("c")
+    assert [c.value for c in ic.get_selected_values()] == ["b", "c"]
+
+
 def test_print(monkeypatch):
     mock = Mock(return_value=None)
     monkeypatch.setattr(DummyOutput, "write", mock)
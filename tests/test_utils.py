@@ -64,6 +64,20 @@ def test_filter_kwargs_empty():
     assert filtered == {}
 
 
+def test_filter_kwargs_caches_signature(monkeypatch):
+    def f(a, b=1):
+        pass
+
+    assert utils.used_kwargs({"a": 1, "c": 3}, f) == {"a": 1}
+
+    def fail(func):
+        raise AssertionError("signature should not be inspected again")
+
+    monkeypatch.setattr(utils, "arguments_of", fail)
+
+    assert utils.used_kwargs({"b": 2, "c": 3}, f) == {"b": 2}
+
+
 def test_required_arguments_of():
     def f(a, b=2, c=None, *args, **kwargs):
         pass